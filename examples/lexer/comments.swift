@@ -0,0 +1,7 @@
+// line comment at top
+/* block */ let a = 1 /* trailing */
+/* outer /* nested */ still outer */
+/* overlapping /*/ close */ done */
+/**/ /***/ let b = a // end
+/* nested but unbalanced /* inner */ tail
+let c = b
@@ -0,0 +1,8 @@
+let ok = 1
+let dollar = $x
+let bad = "\q escape"
+let open = "unterminated
+let after = 2
+let tick = `foo bar
+let digit = `1`
+let end = 3
@@ -0,0 +1 @@
+let tail = `abc
\ No newline at end of file
@@ -0,0 +1,12 @@
+import UIKit
+let `class` = 1
+let _ = $0 + $12
+let café = "é"
+let π = 3.14
+let x = a ∑ b ∘ c
+unowned(safe) var u: AnyObject
+unowned var v: AnyObject
+if #available(iOS 10.0, macOS 10.12, *) { print(#file, #line) }
+let sel = #selector(getter: Foo.bar)
+func f(_ a: Int, b: inout [String: Int]) throws -> Int? { return a >= 0 ? a : nil }
+x += 1; y -= 2; z = x...y; w = a..<b
@@ -0,0 +1,13 @@
+let bin = 0b1010_0101
+let oct = 0o17
+let dec = 12_000
+let hex = 0xFF_FF
+let f1 = 1.5e-3
+let f2 = 0x1.8p1
+let f3 = 0x1p3
+let tuple = t.0.1
+let bad = 0b2
+let s1 = "plain \t \" \\ \u{0041} \u{0001F600} \x41"
+let s2 = "sum: \(a + b) and nested \("inner \(x)")"
+let s3 = "empty group \()"
+let s4 = ""
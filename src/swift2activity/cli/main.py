@@ -1,107 +1,89 @@
 import argparse
-from antlr4 import FileStream, CommonTokenStream
-from ..support.Swift3LexerEx import Swift3LexerEx
-from ..support.Swift3ParserEx import Swift3ParserEx
-
-class TokenStreamAdapter:
-    class _TokenWithGetType:
-        def __init__(self, tok):
-            self._tok = tok
-        def getType(self):
-            # Python runtime koristi .type umjesto getType()
-            return getattr(self._tok, "type", None)
-        def __getattr__(self, name):
-            return getattr(self._tok, name)
-
-    def __init__(self, ts):
-        self.ts = ts
-
-    # parser očekuje METODU index()
-    def index(self):
-        try:
-            return self.ts.index
-        except Exception:
-            return self.ts.index()
-
-    def LA(self, i):
-        return self.ts.LA(i)
-
-    def LT(self, i):
-        return self.ts.LT(i)
-
-    def get(self, i):
-        # vrati wrapper sa .getType()
-        return self._TokenWithGetType(self.ts.get(i))
-
-    def getText(self, interval=None):
-        try:
-            return self.ts.getText(interval)
-        except TypeError:
-            return self.ts.getText()
-
-    def __getattr__(self, name):
-        return getattr(self.ts, name)
-
+import json
+import os
+import time
+from ..frontend.parsing import parse_file
 from ..frontend.ast_visitor import CFGBuilder
+from ..frontend.incremental import IncrementalParser
 from ..emitters.mermaid import to_mermaid
-
-
-def parse_file(path: str):
-    input_stream = FileStream(path, encoding="utf-8")
-    lexer = Swift3LexerEx(input_stream)
-    tokens = CommonTokenStream(lexer)
-    parser = Swift3ParserEx(tokens)
-
-    import generated.Swift3Parser as S3P
-    import generated.Swift3Lexer as S3L
-    from SwiftSupport import SwiftSupport as _SwiftSupport
-
-    S3P.SwiftSupport = _SwiftSupport
-    S3P._input = TokenStreamAdapter(parser._input)
-
-    LexCls = S3L.Swift3Lexer
-
-    def _tok_id(name: str):
-        val = getattr(LexCls, name, None)
-        if val is not None:
-            return val
-        try:
-            return LexCls.symbolicNames.index(name)
-        except Exception:
-            return None
-
-    for _name in getattr(LexCls, "symbolicNames", []) or []:
-        if not _name or not _name.isidentifier():
-            continue
-        _val = _tok_id(_name)
-        if _val is not None and not hasattr(S3P, _name):
-            setattr(S3P, _name, _val)
-
-    if not hasattr(S3P, "WS"):
-        raise RuntimeError("Swift3Lexer nema token 'WS' – provjeri naziv whitespace tokena u lekserskoj gramatici.")
-
-
-    if hasattr(parser, "top_level"):
-        tree = parser.top_level()
-    else:
-        for rule in ("compilation_unit", "source", "program", "translation_unit"):
-            if hasattr(parser, rule):
-                tree = getattr(parser, rule)()
-                break
-        else:
-            raise RuntimeError("Nepoznat start rule za Swift3.g4")
-
-    return tree, tokens
-
+from ..emitters.batch import dedupe_graphs
+
+
+def run_batch(inputs, out_dir: str, fast_lexer: bool = False) -> None:
+    """Svaka funkcija iz svih ulaza; identični grafovi se pišu samo jednom + index.json."""
+    named = []
+    for path in inputs:
+        tree, tokens = parse_file(path, fast_lexer=fast_lexer)
+        for name, g in CFGBuilder().build_all_from_tree(tree, tokens=tokens):
+            named.append((f"{path}::{name}", g))
+
+    artifacts, index = dedupe_graphs(named)
+    os.makedirs(out_dir, exist_ok=True)
+    for key, mmd in artifacts.items():
+        with open(os.path.join(out_dir, f"{key[:16]}.mmd"), "w", encoding="utf-8") as f:
+            f.write(mmd)
+    for entry in index.values():
+        entry["file"] = f"{entry['artifact'][:16]}.mmd"
+    with open(os.path.join(out_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    print(f"OK: {len(index)} funkcija, {len(artifacts)} različitih grafova u {out_dir}")
+
+
+def watch(path: str, output: str, fast_lexer: bool = False, interval: float = 0.5) -> None:
+    """Prati fajl; nakon izmjene re-parsira samo izmijenjene deklaracije i prepisuje output."""
+    def _read():
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def _write(inc):
+        graphs = inc.graphs()
+        cfg = graphs[0][1] if graphs else CFGBuilder().build_from_function(None)
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(to_mermaid(cfg))
+
+    inc = IncrementalParser(_read(), fast_lexer=fast_lexer)
+    _write(inc)
+    print(f"OK: napisao {output}; pratim {path} (Ctrl+C za kraj)")
+    mtime = os.path.getmtime(path)
+    try:
+        while True:
+            time.sleep(interval)
+            m = os.path.getmtime(path)
+            if m == mtime:
+                continue
+            mtime = m
+            t0 = time.perf_counter()
+            mode = inc.update(_read())
+            _write(inc)
+            print(f"{mode}: {(time.perf_counter() - t0) * 1000:.1f} ms")
+    except KeyboardInterrupt:
+        pass
 
 
 def main():
     ap = argparse.ArgumentParser(description="Swift -> UML Activity (Mermaid)")
-    ap.add_argument("input", help="Swift file")
+    ap.add_argument("input", nargs="+", help="Swift file(s)")
     ap.add_argument("-o", "--output", default="out.mmd")
+    ap.add_argument("--batch", metavar="DIR",
+                    help="sve funkcije iz svih ulaza; jedan .mmd po različitom grafu + index.json")
+    ap.add_argument("--fast-lexer", action="store_true",
+                    help="regex tokenizer umjesto ANTLR leksera (isti token stream)")
+    ap.add_argument("--watch", action="store_true",
+                    help="prati ulazni fajl i inkrementalno osvježava output")
     args = ap.parse_args()
 
-    tree, tokens = parse_file(args.input)
+    if args.watch and args.batch:
+        ap.error("--watch i --batch se ne mogu kombinovati")
+    if args.batch:
+        run_batch(args.input, args.batch, fast_lexer=args.fast_lexer)
+        return
+
+    if len(args.input) > 1:
+        ap.error("više ulaznih fajlova zahtijeva --batch")
+    if args.watch:
+        watch(args.input[0], args.output, fast_lexer=args.fast_lexer)
+        return
+    tree, tokens = parse_file(args.input[0], fast_lexer=args.fast_lexer)
     cfg = CFGBuilder().build_from_tree(tree, tokens=tokens)
     mmd = to_mermaid(cfg)
     with open(args.output, "w", encoding="utf-8") as f:
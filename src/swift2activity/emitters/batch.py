@@ -0,0 +1,30 @@
+from __future__ import annotations
+from typing import Dict, Iterable, Tuple
+from ..ir.cfg import Graph
+from .mermaid import to_mermaid
+
+def dedupe_graphs(
+    named: Iterable[Tuple[str, Graph]]
+) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
+    """
+    Renderuj svaki strukturno različit graf samo jednom.
+    Vraća (artifacts, index):
+    - artifacts: hash (sa labelama) → Mermaid tekst
+    - index: ime funkcije → {"artifact": hash sa labelama, "shape": hash bez labela}
+    Isto ime koje se ponovi (npr. ista funkcija u dvije #if grane) dobija
+    sufiks '#2', '#3', ... – nijedna funkcija se ne gubi.
+    """
+    artifacts: Dict[str, str] = {}
+    index: Dict[str, Dict[str, str]] = {}
+    for name, g in named:
+        key = g.structural_hash(include_labels=True)
+        if key not in artifacts:
+            artifacts[key] = to_mermaid(g)
+        entry = name
+        n = 1
+        while entry in index:
+            n += 1
+            entry = f"{name}#{n}"
+        index[entry] = {"artifact": key, "shape": g.structural_hash(include_labels=False)}
+
+    return artifacts, index
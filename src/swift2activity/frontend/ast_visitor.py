@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Tuple
 from antlr4 import ParserRuleContext
 from ..ir.nodes import Initial, Final, Action, Decision, Merge
 from ..ir.cfg import Graph
@@ -15,13 +15,61 @@ def _ctx_text(ctx: ParserRuleContext, tokens) -> str:
             return ctx.__class__.__name__
 
 
+_OWNER_DECLS = (
+    "class_declaration", "struct_declaration", "enum_declaration",
+    "extension_declaration", "protocol_declaration",
+)
+
+
 class CFGBuilder:
     def build_from_tree(self, tree, tokens=None) -> Graph:
+        func = self._find_first_by_name(tree, "function_declaration")
+        return self.build_from_function(func, tokens=tokens)
+
+    def build_all_from_tree(self, tree, tokens=None) -> List[Tuple[str, Graph]]:
+        """Vrati (ime, graf) za SVAKU function_declaration u stablu, redom pojavljivanja."""
+        out = []
+        for func in self._find_all_by_name(tree, "function_declaration"):
+            out.append((self._qualified_name(func, tokens), self.build_from_function(func, tokens=tokens)))
+        return out
+
+    def _qualified_name(self, func_ctx, tokens=None) -> str:
+        """
+        Ime funkcije sa parametrima, prefiksirano obuhvatajućim tipovima i
+        funkcijama (npr. 'Foo.bar(_:Int)', lokalna: 'Foo.bar(_:Int).helper()'),
+        pa se overload-i i lokalne funkcije ne sudaraju.
+        """
+        return ".".join(self.owner_names(func_ctx, tokens) + [self._function_label(func_ctx, tokens)])
+
+    def _function_label(self, func_ctx, tokens=None) -> str:
+        name_ctx = self._call_child(func_ctx, "function_name")
+        name = _ctx_text(name_ctx, tokens) if name_ctx is not None else "<anonymous>"
+        params = self._call_child(self._call_child(func_ctx, "function_signature"), "parameter_clause")
+        sig = _ctx_text(params, tokens) if params is not None else "()"
+        return " ".join(name.split()) + " ".join(sig.split())
+
+    def owner_names(self, ctx, tokens=None) -> List[str]:
+        """Imena tipova (class/struct/enum/extension/protocol) i funkcija iznad ctx, od spoljnjeg ka unutrašnjem."""
+        parts = []
+        parent = getattr(ctx, "parentCtx", None)
+        while parent is not None:
+            cname = parent.__class__.__name__.lower()
+            if cname.startswith("function_declaration"):
+                parts.append(self._function_label(parent, tokens))
+            elif cname.startswith(_OWNER_DECLS):
+
+                owner = (self._find_first_by_name(parent, cname.split("_declaration")[0] + "_name")
+                         or self._find_first_by_name(parent, "type_identifier"))
+                if owner is not None:
+                    parts.append(" ".join(_ctx_text(owner, tokens).split()))
+            parent = getattr(parent, "parentCtx", None)
+        return list(reversed(parts))
+
+    def build_from_function(self, func, tokens=None) -> Graph:
         g = Graph()
         start = g.add(Initial())
         end = g.add(Final())  
 
-        func = self._find_first_by_name(tree, "function_declaration")
         body = self._call_child(func, "function_body")
         block = self._call_child(body, "code_block")
 
@@ -0,0 +1,420 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple
+from antlr4 import InputStream, Token
+from antlr4.error.ErrorListener import ErrorListener
+from ..ir.cfg import Graph
+from .ast_visitor import CFGBuilder
+from .parsing import parse_stream
+
+_WS = " \n\r\t\u000B\u000C\u0000"
+
+
+class _CountErrors(ErrorListener):
+    def __init__(self):
+        self.count = 0
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.count += 1
+
+
+class _Offsets:
+    """
+    Početci uzastopnih deklaracija kao Fenwick stablo razmaka između susjednih
+    početaka: pomjeranje svih od k-te, čitanje početka i traženje po offsetu su
+    O(log n), pa izmjena jedne deklaracije ne obilazi ostale.
+    """
+
+    def __init__(self, starts: List[int]):
+        self.n = len(starts)
+        self.gaps = [st - prev for st, prev in zip(starts, [0] + starts[:-1])]
+        self.tree = [0] * (self.n + 1)
+        for i, gap in enumerate(self.gaps, 1):
+            self.tree[i] += gap
+            j = i + (i & -i)
+            if j <= self.n:
+                self.tree[j] += self.tree[i]
+
+    def _add(self, k: int, d: int) -> None:
+        self.gaps[k] += d
+        i = k + 1
+        while i <= self.n:
+            self.tree[i] += d
+            i += i & -i
+
+    def get(self, k: int) -> int:
+        """Početak k-te deklaracije."""
+        i, total = k + 1, 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def shift_from(self, k: int, delta: int) -> None:
+        """Pomjeri početke k, k+1, ... za delta."""
+        if k < self.n and delta:
+            self._add(k, delta)
+
+    def set(self, k: int, start: int) -> None:
+        """Postavi početak k-te deklaracije, ostale ostaju gdje jesu."""
+        d = start - self.get(k)
+        if d:
+            self._add(k, d)
+            if k + 1 < self.n:
+                self._add(k + 1, -d)
+
+    def rank(self, pos: int) -> int:
+        """Broj deklaracija koje počinju najkasnije na pos (kao bisect_right nad početcima)."""
+        i, total = 0, 0
+        step = 1 << self.n.bit_length()
+        while step:
+            j = i + step
+            if j <= self.n and total + self.tree[j] <= pos:
+                i = j
+                total += self.tree[j]
+            step >>= 1
+        return i
+
+    def starts(self) -> List[int]:
+        out, total = [], 0
+        for gap in self.gaps:
+            total += gap
+            out.append(total)
+        return out
+
+
+class _Unit:
+    """
+    Jedna deklaracija sa svojim parse stablom, token streamom i grafovima.
+    Početak se ne čuva u deklaraciji nego u _Offsets vlasnika (apsolutno za
+    top-level, relativno u odnosu na početak tipa za članove).
+    - tip sa članovima: offsets su početci članova, lead je (relativan) početak
+      whitespace-a ispred prvog člana, prefix je ime vlasnika za grafove članova
+    """
+    def __init__(self, ctx, tokens, length: int, graphs, members=None, prefix: str = "", lead: int = 0):
+        self.ctx = ctx
+        self.tokens = tokens
+        self.length = length
+        self.graphs: List[Tuple[str, Graph]] = graphs
+        self.members: Optional[List[_Unit]] = members
+        self.offsets: Optional[_Offsets] = None
+        self.prefix = prefix
+        self.lead = lead
+
+
+class IncrementalParser:
+    """
+    Drži tokene i rezultate parsiranja po deklaraciji; izmjena unutar jedne
+    deklaracije re-parsira samo nju (članovi tipa i praznine između njih →
+    'declarations', inače 'statement'), a grafovi ostalih deklaracija se ponovo
+    koriste. Sve što se ne može bezbjedno lokalizovati ide na puni re-parse.
+    """
+
+    def __init__(self, text: str, fast_lexer: bool = False):
+        self.fast_lexer = fast_lexer
+        self.builder = CFGBuilder()
+        self.text = text
+        self.last_mode = "full"
+        self._full(text)
+
+    def graphs(self) -> List[Tuple[str, Graph]]:
+        """Isto što i CFGBuilder().build_all_from_tree nad cijelim fajlom, redom pojavljivanja."""
+        out = []
+        for u in self.units:
+            if u.members is None:
+                out.extend(u.graphs)
+            else:
+                for m in u.members:
+                    out.extend(m.graphs)
+        return out
+
+    def update(self, new_text: str) -> str:
+        """Primijeni novi sadržaj fajla (izmjena = razlika zajedničkog prefiksa/sufiksa)."""
+        old = self.text
+        start = _common_prefix(old, new_text)
+        tail = _common_suffix(old, new_text, min(len(old), len(new_text)) - start)
+        return self.apply_edit(start, len(old) - tail, new_text[start:len(new_text) - tail])
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> str:
+        """
+        Zamijeni text[start:end] sa replacement.
+        Vraća način ažuriranja: 'member' | 'top' | 'gap' | 'full'.
+        """
+        old = self.text
+        new = old[:start] + replacement + old[end:]
+        delta = len(replacement) - (end - start)
+        mode = self._try_incremental(old, new, start, end, replacement, delta)
+        if mode is None:
+            self._full(new)
+            mode = "full"
+        self.text = new
+        self.last_mode = mode
+        return mode
+
+    # ---- puni parse
+
+    def _full(self, text: str) -> None:
+        tree, tokens = parse_stream(InputStream(text), fast_lexer=self.fast_lexer)
+        statements = _top_statements(tree)
+        self.units = [self._make_top(st, tokens) for st in statements]
+        self._offsets = _Offsets([st.start.start for st in statements])
+
+    def _make_top(self, st, tokens) -> _Unit:
+        unit = _Unit(st, tokens, st.stop.stop + 1 - st.start.start, graphs=[])
+        members = _member_declarations(st)
+        total = len(self.builder._find_all_by_name(st, "function_declaration"))
+        in_members = sum(len(self.builder._find_all_by_name(m, "function_declaration")) for m in members)
+        if members and total == in_members:
+            unit.prefix = ".".join(self.builder.owner_names(members[0], tokens))
+            unit.lead = _lead(members[0], tokens) - st.start.start
+            unit.members = [
+                _Unit(m, tokens, m.stop.stop + 1 - m.start.start,
+                      graphs=self.builder.build_all_from_tree(m, tokens=tokens), prefix=unit.prefix)
+                for m in members
+            ]
+            unit.offsets = _Offsets([m.start.start - st.start.start for m in members])
+        else:
+            unit.graphs = self.builder.build_all_from_tree(st, tokens=tokens)
+        return unit
+
+    # ---- inkrementalno
+
+    def _try_incremental(self, old: str, new: str, start: int, end: int, replacement: str, delta: int) -> Optional[str]:
+        # komentari mogu promijeniti leksiranje ostatka fajla
+        touched = (old[max(0, start - 1):end + 1], new[max(0, start - 1):start + len(replacement) + 1])
+        if any("/*" in t or "*/" in t for t in touched):
+            return None
+
+        offsets = self._offsets
+        # praznina ispred units[g + 1]; umetanje tačno na početak deklaracije spada u nju
+        g = offsets.rank(end - 1) - 1
+        prev_end = offsets.get(g) + self.units[g].length if g >= 0 else 0
+        nxt = offsets.get(g + 1) if g + 1 < len(self.units) else len(old)
+        if prev_end <= start and end <= nxt and _blank(old[prev_end:nxt]) and _blank(replacement):
+            # praznina između deklaracija je čist whitespace (komentar u njoj, npr. '//',
+            # može progutati ili pustiti susjedni kod); ne smije spojiti dva susjedna tokena
+            if g >= 0 and g + 1 < len(self.units) and nxt - prev_end > 0 and nxt - prev_end + delta == 0:
+                return None
+            offsets.shift_from(g + 1, delta)
+            return "gap"
+
+        i = offsets.rank(start) - 1
+        if i < 0:
+            return None
+        unit, base = self.units[i], offsets.get(i)
+        if not _contains(old, base, unit.length, start, end):
+            return None
+
+        if unit.members is not None:
+            mode = self._reparse_members(old, new, unit, base, start, end, delta)
+            if mode is not None:
+                offsets.shift_from(i + 1, delta)
+                return mode
+
+        if self._reparse_top(new, i, base, delta):
+            offsets.shift_from(i + 1, delta)
+            return "top"
+        return None
+
+    def _reparse_members(self, old: str, new: str, unit: _Unit, base: int, start: int, end: int,
+                         delta: int) -> Optional[str]:
+        """
+        Re-parsiraj samo dio tijela tipa koji izmjena dira: jedan član, ili prazninu
+        (od kraja prethodnog člana / 'lead' do početka sljedećeg / '}') zajedno sa
+        članovima koje izmjena zahvata. Dodati i obrisani članovi mijenjaju listu,
+        ostali zadržavaju grafove. Vraća 'member' | 'gap' ili None.
+        """
+        ms, offsets = unit.members, unit.offsets
+        close = unit.length - 1
+        if old[base + close] != "}":
+            return None
+        s, e = start - base, end - base
+
+        # praznina k: od member_end(k - 1) do member_start(k) (ispred člana k, zadnja ispred '}')
+        def member_start(k):
+            return offsets.get(k) if k < len(ms) else close
+
+        def member_end(k):
+            return offsets.get(k) + ms[k].length if k >= 0 else unit.lead
+
+        j = offsets.rank(s) - 1
+        a = j + 1 if s >= member_end(j) else j
+        b = offsets.rank(e - 1)
+        if b == len(ms) and e > close:
+            b += 1
+        regions = []
+        if 0 <= a == b:
+            regions.append((a, b, member_end(a - 1), member_start(b), True))
+        if j >= 0 and _contains(old, base + offsets.get(j), ms[j].length, start, end):
+            regions.append((j, j + 1, offsets.get(j), offsets.get(j) + ms[j].length, False))
+        if 0 <= a < b <= len(ms):
+            regions.append((a, b, member_end(a - 1), member_start(b), True))
+        for a, b, lo, hi, gap in regions:
+            mode = self._replace_members(new, unit, base, a, b, lo, hi, delta, gap)
+            if mode is not None:
+                return mode
+        return None
+
+    def _replace_members(self, new: str, unit: _Unit, base: int, a: int, b: int, lo: int, hi: int,
+                         delta: int, gap: bool) -> Optional[str]:
+        """Zamijeni članove a..b-1 deklaracijama iz novog sadržaja [lo, hi) (relativno u unit)."""
+        text = new[base + lo:base + hi + delta]
+        # novi sadržaj praznine ne smije se zalijepiti za susjedne tokene
+        if gap and (not text or text[0] not in _WS or text[-1] not in _WS):
+            return None
+        body = text.strip(_WS)
+        fresh = []
+        if body:
+            parsed = self._parse_slice(body, "declarations", brace_end=False)
+            if parsed is None:
+                return None
+            ctx, tokens = parsed
+            off = lo + len(text) - len(text.lstrip(_WS))
+            for d in ctx.children:
+                if d.__class__.__name__ != "DeclarationContext":
+                    continue
+                graphs = [
+                    (f"{unit.prefix}.{name}" if unit.prefix else name, g)
+                    for name, g in self.builder.build_all_from_tree(d, tokens=tokens)
+                ]
+                fresh.append((off + d.start.start,
+                              _Unit(d, tokens, d.stop.stop + 1 - d.start.start, graphs, prefix=unit.prefix)))
+        offsets = unit.offsets
+        if len(fresh) == b - a:
+            offsets.shift_from(b, delta)
+            for k, (st, _) in enumerate(fresh):
+                offsets.set(a + k, st)
+        else:
+            # broj članova se mijenja → indeksi iza se pomjeraju, pa se početci grade iznova
+            starts = offsets.starts()
+            unit.offsets = _Offsets(starts[:a] + [st for st, _ in fresh] + [st + delta for st in starts[b:]])
+        unit.members[a:b] = [m for _, m in fresh]
+        unit.length += delta
+        return "gap" if a == b and not fresh else "member"
+
+    def _reparse_top(self, new: str, i: int, base: int, delta: int) -> bool:
+        u = self.units[i]
+        parsed = self._parse_slice(new[base:base + u.length + delta], "statement")
+        if parsed is None:
+            return False
+        st, tokens = parsed
+        if self.builder._call_child(st, "declaration") is None:
+            return False
+        self.units[i] = self._make_top(st, tokens)
+        return True
+
+    def _parse_slice(self, text: str, rule: str, brace_end: bool = True):
+        """
+        Parsiraj isječak; None ako ima grešaka, ne troši sve tokene ili ne završava
+        sa '}' (brace_end). Top-level statement bez '}' na kraju mogao bi se u punom
+        fajlu nastaviti sljedećim ('x = y' + '(a)'); član tipa ne može, jer iza njega
+        dolazi nova deklaracija ili '}' tijela.
+        """
+        errors = _CountErrors()
+        ctx, tokens = parse_stream(InputStream(text), rule=rule, fast_lexer=self.fast_lexer, errors=errors)
+        if errors.count or tokens.LA(1) != Token.EOF:
+            return None
+        if ctx.start is None or ctx.stop is None or (brace_end and ctx.stop.text != "}"):
+            return None
+        if ctx.start.start != 0 or ctx.stop.stop != len(text) - 1:
+            return None
+        return ctx, tokens
+
+def diff_against_full(inc: IncrementalParser) -> Optional[str]:
+    """Uporedi inkrementalne grafove sa punim re-parse-om; None ako su isti."""
+    tree, tokens = parse_stream(InputStream(inc.text), fast_lexer=inc.fast_lexer)
+    full = CFGBuilder().build_all_from_tree(tree, tokens=tokens)
+    got = inc.graphs()
+    if [n for n, _ in full] != [n for n, _ in got]:
+        return f"imena: full={[n for n, _ in full]!r} inc={[n for n, _ in got]!r}"
+    for (name, a), (_, b) in zip(full, got):
+        if a.structural_hash() != b.structural_hash():
+            return f"graf se razlikuje: {name}"
+    return None
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Dužina zajedničkog prefiksa; binarna pretraga poređenjem isječaka (bez petlje po znaku)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Dužina zajedničkog sufiksa, najviše limit znakova."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _blank(text: str) -> bool:
+    return not text.strip(_WS)
+
+
+def _contains(text: str, u_start: int, u_len: int, start: int, end: int) -> bool:
+    """Izmjena [start, end) je unutar deklaracije i ne lijepi se za susjedne tokene."""
+    u_end = u_start + u_len
+    if start < u_start or end > u_end:
+        return False
+    if start == u_start and start > 0 and text[start - 1] not in _WS:
+        return False
+    if end == u_end and end < len(text) and text[end] not in _WS:
+        return False
+    return True
+
+
+def _lead(ctx, tokens) -> int:
+    """Offset whitespace tokena neposredno ispred ctx (ili ctx.start.start ako ga nema)."""
+    k = ctx.start.tokenIndex
+    if k > 0:
+        prev = tokens.get(k - 1)
+        if prev.text and _blank(prev.text):
+            return prev.start
+    return ctx.start.start
+
+
+def _top_statements(tree) -> list:
+    """Statement-i na vrhu fajla (statements_impl je rekurzivan lanac, pa iterativno)."""
+    out = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.__class__.__name__ == "StatementContext":
+            out.append(node)
+            continue
+        for ch in reversed(getattr(node, "children", []) or []):
+            if ch.__class__.__name__ in ("StatementContext", "StatementsContext", "Statements_implContext"):
+                stack.append(ch)
+    return out
+
+
+def _member_declarations(st) -> list:
+    """Deklaracije-članovi tipa deklarisanog u top-level statement-u (bez ugniježđenih)."""
+    decl = next((ch for ch in getattr(st, "children", []) or []
+                 if ch.__class__.__name__ == "DeclarationContext"), None)
+    if decl is None:
+        return []
+    out = []
+
+    def walk(ctx):
+        for ch in getattr(ctx, "children", []) or []:
+            if ch.__class__.__name__ == "DeclarationContext":
+                out.append(ch)
+            else:
+                walk(ch)
+
+    for ch in getattr(decl, "children", []) or []:
+        cname = ch.__class__.__name__.lower()
+        if cname.startswith(("class_declaration", "struct_declaration", "enum_declaration",
+                             "extension_declaration")):
+            walk(ch)
+    return out
@@ -1,4 +1,6 @@
-from typing import List, Tuple, Optional
+import hashlib
+import heapq
+from typing import Dict, List, Tuple, Optional
 from .nodes import Node
 
 Edge = Tuple[int, int, Optional[str]]
@@ -14,3 +16,192 @@ class Graph:
 
     def link(self, a: int, b: int, label: str | None = None) -> None:
         self.edges.append((a, b, label))
+
+    def structural_hash(self, include_labels: bool = True) -> str:
+        """
+        SHA-256 kanonskog oblika grafa: isti za izomorfne grafove, bez obzira na
+        redoslijed čvorova i ivica, a različit za neizomorfne.
+        - include_labels=True  → tekst čvorova i ivica ulazi u hash
+        - include_labels=False → samo oblik: vrste čvorova i da li ivica ima labelu
+        """
+        payload = repr(_Canon(self, include_labels).form()).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+
+def _node_sig(n: Node, include_labels: bool) -> Tuple[str, str]:
+    kind = n.__class__.__name__
+    if not include_labels:
+        return (kind, "")
+    return (kind, getattr(n, "label", getattr(n, "cond", "")) or "")
+
+def _edge_sig(lbl: Optional[str], include_labels: bool) -> str:
+    if not lbl:
+        return ""
+    return lbl if include_labels else "*"
+
+class _Canon:
+    """
+    Kanonsko označavanje individualizacijom i profinjavanjem (kao nauty):
+    uređena particija čvorova se profinjuje do ekvitabilne (Hopcroft); ako neka
+    ćelija ostane neriješena, svaki njen čvor se redom individualizuje i pretraga
+    se nastavlja. Kanonski oblik je leksikografski najmanji zapis među listovima.
+    Simetrične grane (npr. identični case-ovi) se odsijecaju preko pronađenih
+    automorfizama, pa pretraga ostaje polinomijalna za uobičajene CFG-ove.
+    """
+
+    def __init__(self, g: Graph, include_labels: bool):
+        self.sigs = [_node_sig(n, include_labels) for n in g.nodes]
+        self.edges = [(a, _edge_sig(lbl, include_labels), b) for a, b, lbl in g.edges]
+        # relacija po vrsti ivice: rel[t][y] = čvorovi x sa ivicom x -t-> y (t = smjer, labela)
+        rel: Dict[Tuple[str, str], List[List[int]]] = {}
+        for a, e, b in self.edges:
+            for t, x, y in ((("out", e), a, b), (("in", e), b, a)):
+                if t not in rel:
+                    rel[t] = [[] for _ in g.nodes]
+                rel[t][y].append(x)
+        self.rel = [rel[t] for t in sorted(rel)]
+        self.first = None   # (zapis, redoslijed, put) prvog lista
+        self.best = None    # (zapis, redoslijed) najmanjeg lista
+        self.autos: List[Dict[int, int]] = []   # samo pomjereni čvorovi
+
+    def form(self):
+        if not self.sigs:
+            return ((), ())
+        by_sig: Dict[Tuple[str, str], List[int]] = {}
+        for v, sig in enumerate(self.sigs):
+            by_sig.setdefault(sig, []).append(v)
+        col = [0] * len(self.sigs)
+        cells: Dict[int, List[int]] = {}
+        start = 0
+        for sig in sorted(by_sig):
+            cell = by_sig[sig]
+            for v in cell:
+                col[v] = start
+            cells[start] = cell
+            start += len(cell)
+        self._refine(col, cells, sorted(cells))
+        self._search(col, cells, [])
+        return self.best[0]
+
+    def _refine(self, col: List[int], cells: Dict[int, List[int]], queue: List[int]) -> None:
+        """
+        Profini uređenu particiju (col[v] = početak ćelije u redoslijedu) do ekvitabilne.
+        Ćelija se dijeli po broju susjeda u ćeliji-djelitelju; dijelovi idu redom broja,
+        pa je rezultat nezavisan od numeracije čvorova.
+        """
+        pending = set(queue)
+        heapq.heapify(queue)
+        while queue:
+            w = heapq.heappop(queue)
+            pending.discard(w)
+            splitter = list(cells[w])
+            for rel in self.rel:
+                count: Dict[int, int] = {}
+                for y in splitter:
+                    for x in rel[y]:
+                        count[x] = count.get(x, 0) + 1
+                hit = sorted({col[x] for x in count})
+                for s in hit:
+                    cell = cells[s]
+                    if len(cell) == 1:
+                        continue
+                    groups: Dict[int, List[int]] = {}
+                    for x in cell:
+                        groups.setdefault(count.get(x, 0), []).append(x)
+                    if len(groups) == 1:
+                        continue
+                    parts = [groups[k] for k in sorted(groups)]
+                    starts = []
+                    off = s
+                    for part in parts:
+                        cells[off] = part
+                        for x in part:
+                            col[x] = off
+                        starts.append(off)
+                        off += len(part)
+                    if s in pending:
+                        new = starts[1:]
+                    else:
+                        largest = max(range(len(parts)), key=lambda k: (len(parts[k]), -k))
+                        new = [st for k, st in enumerate(starts) if k != largest]
+                    for st in new:
+                        if st not in pending:
+                            pending.add(st)
+                            heapq.heappush(queue, st)
+
+    def _search(self, col: List[int], cells: Dict[int, List[int]], path: List[int]) -> int:
+        """Vraća dubinu do koje se pretraga vraća (manja od len(path) → odsijeci i ovaj čvor)."""
+        target = next((s for s in sorted(cells) if len(cells[s]) > 1), None)
+        if target is None:
+            return self._leaf(col, path)
+
+        depth = len(path)
+        fixed = set(path)
+        orbits = _Orbits()
+        used = 0
+        done: List[int] = []
+        for v in sorted(cells[target]):
+            # v u orbiti već obrađenog čvora (pod automorfizmima koji fiksiraju put) → isto podstablo
+            for gamma in self.autos[used:]:
+                if fixed.isdisjoint(gamma):
+                    for x, y in gamma.items():
+                        orbits.union(x, y)
+            used = len(self.autos)
+            if orbits.find(v) in {orbits.find(d) for d in done}:
+                continue
+            done.append(v)
+            child_col = list(col)
+            child_cells = dict(cells)
+            child_cells[target] = [v]
+            child_cells[target + 1] = [x for x in cells[target] if x != v]
+            for x in child_cells[target + 1]:
+                child_col[x] = target + 1
+            self._refine(child_col, child_cells, [target])
+            back = self._search(child_col, child_cells, path + [v])
+            if back < depth:
+                return back
+        return depth
+
+    def _leaf(self, col: List[int], path: List[int]) -> int:
+        order = sorted(range(len(col)), key=col.__getitem__)
+        cert = (tuple(self.sigs[v] for v in order),
+                tuple(sorted((col[a], e, col[b]) for a, e, b in self.edges)))
+        if self.first is None:
+            self.first = (cert, order, path)
+            self.best = (cert, order)
+            return len(path)
+        if cert == self.first[0]:
+            # automorfizam prvi list → ovaj: podstablo od mjesta razilaženja je već pokriveno
+            self._add_auto(self.first[1], order)
+            first_path = self.first[2]
+            common = 0
+            while common < min(len(path), len(first_path)) and path[common] == first_path[common]:
+                common += 1
+            return common
+        if cert == self.best[0]:
+            self._add_auto(self.best[1], order)
+        elif cert < self.best[0]:
+            self.best = (cert, order)
+        return len(path)
+
+    def _add_auto(self, a: List[int], b: List[int]) -> None:
+        self.autos.append({x: y for x, y in zip(a, b) if x != y})
+
+
+class _Orbits:
+    """Union-find nad čvorovima koje pomjeraju pronađeni automorfizmi."""
+
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent.get(x, x) != x:
+            parent[x] = parent.get(parent[x], parent[x])
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> None:
+        rx, ry = self.find(x), self.find(y)
+        if rx != ry:
+            self.parent[rx] = ry
@@ -0,0 +1,389 @@
+"""
+Ručno pisani Swift tokenizer na kompajliranim regexima.
+
+Zamjena za Swift3LexerEx: vraća CommonToken-e sa istim tipovima, kanalima,
+offsetima i line/column vrijednostima, pa ga Swift3ParserEx čita kroz
+CommonTokenStream bez izmjena. Semantika prati ANTLR lekser iz Swift3.g4:
+najduže poklapanje, a kod iste dužine pobjeđuje pravilo definisano ranije
+(= manji tip tokena). Tipovi se čitaju iz generisanog Swift3Lexer-a.
+"""
+import re
+from antlr4 import Token
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Lexer import TokenSource
+from antlr4.Recognizer import Recognizer
+from generated.Swift3Lexer import Swift3Lexer
+
+
+# ---- klase karaktera, prepisane iz lekserskih pravila Swift3.g4
+_HEAD = (
+    "a-zA-Z_\u00A8\u00AA\u00AD\u00AF\u00B2-\u00B5"
+    "\u00B7-\u00BA\u00BC-\u00BE\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u00FF\u0100-\u02FF\u0370-\u167F"
+    "\u1681-\u180D\u180F-\u1DBF\u1E00-\u1FFF\u200B-\u200D\u202A-\u202E\u203F-\u2040\u2054"
+    "\u2060-\u206F\u2070-\u20CF\u2100-\u218F\u2460-\u24FF\u2776-\u2793\u2C00-\u2DFF\u2E80-\u2FFF"
+    "\u3004-\u3007\u3021-\u302F\u3031-\u303F\u3040-\uD7FF\uF900-\uFD3D\uFD40-\uFDCF\uFDF0-\uFE1F"
+    "\uFE30-\uFE44\uFE47-\uFFFD"
+)
+_CHAR = _HEAD + "0-9\u0300-\u036F\u1DC0-\u1DFF\u20D0-\u20FF\uFE20-\uFE2F"
+_OP_HEAD_OTHER = (
+    "\u00A1-\u00A7\u00A9\u00AB\u00AC\u00AE\u00B0-\u00B1\u00B6\u00BB\u00BF\u00D7\u00F7\u2016-\u2017\u2020-\u2027"
+    "\u2030-\u203E\u2041-\u2053\u2055-\u205E\u2190-\u23FF\u2500-\u2775"
+    "\u2794-\u2BFF\u2E00-\u2E7F\u3001-\u3003\u3008-\u3030"
+)
+_OP_FOLLOWING = "\u0300-\u036F\u1DC0-\u1DFF\u20D0-\u20FF\uFE00-\uFE0F\uFE20-\uFE2F"
+_WS_CHARS = " \n\r\t\u000B\u000C\u0000"
+_HEX = "0123456789abcdefABCDEF"
+
+_IDENTIFIER = re.compile(f"[{_HEAD}][{_CHAR}]*|`[{_HEAD}][{_CHAR}]*`|\\$[0-9]+")
+_BACKTICK_PREFIX = re.compile(f"`(?:[{_HEAD}][{_CHAR}]*)?")
+_PLATFORM = re.compile(
+    "(?:iOSApplicationExtension|iOS|macOSApplicationExtension|macOS|watchOS|tvOS)"
+    f"[{_WS_CHARS}]+[0-9]+(?:\\.[0-9]+(?:\\.[0-9]+)?)?"
+)
+_WS = re.compile(f"[{_WS_CHARS}]+")
+_BINARY = re.compile(r"0b[01][01_]*")
+_OCTAL = re.compile(r"0o[0-7][0-7_]*")
+_DECIMAL = re.compile(r"[0-9][0-9_]*")
+_HEXADECIMAL = re.compile(r"0x[0-9a-fA-F][0-9a-fA-F_]*")
+_FLOAT_DECIMAL = re.compile(r"[0-9][0-9_]*(?:\.[0-9][0-9_]*)?(?:[eE][+\-]?[0-9][0-9_]*)?")
+_FLOAT_HEXADECIMAL = re.compile(
+    r"0x[0-9a-fA-F][0-9a-fA-F_]*(?:\.[0-9a-fA-F][0-9a-fA-F_]*)?[pP][+\-]?[0-9][0-9_]*"
+)
+_STATIC_STRING = re.compile(
+    r'"(?:\\[0\\tnr"\']|\\x[0-9a-fA-F]{2}|\\u\{[0-9a-fA-F]{4}(?:[0-9a-fA-F]{4})?\}'
+    r'|[^"\n\r\\])*"'
+)
+_OP_HEAD_OTHER_RE = re.compile(f"[{_OP_HEAD_OTHER}]")
+_OP_FOLLOWING_RE = re.compile(f"[{_OP_FOLLOWING}]")
+
+
+def _unquote_literal(name: str) -> str:
+    """'\\u00A8' → stvarni znak; literalNames su Java-escapovani stringovi pod navodnicima."""
+    body = name[1:-1]
+    out, i = [], 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\" and i + 1 < len(body):
+            nxt = body[i + 1]
+            if nxt == "u":
+                out.append(chr(int(body[i + 2:i + 6], 16)))
+                i += 6
+                continue
+            out.append({"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f"}.get(nxt, nxt))
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+class _TokenTable:
+    """Tipovi tokena iz generisanog leksera (isti brojevi, isti prioriteti)."""
+
+    def __init__(self, lexer_cls):
+        self.literals = {}
+        for ttype, name in enumerate(getattr(lexer_cls, "literalNames", []) or []):
+            if name and len(name) >= 2 and name[0] == "'" and name[-1] == "'":
+                self.literals[_unquote_literal(name)] = ttype
+        self.prefixes = {lit[:k] for lit in self.literals for k in range(1, len(lit) + 1)}
+        # najduži literal prvi → re alternacija daje najduže poklapanje
+        ordered = sorted(self.literals, key=len, reverse=True)
+        self.literal_re = re.compile("|".join(re.escape(lit) for lit in ordered))
+
+        def _t(name):
+            return getattr(lexer_cls, name)
+
+        self.Identifier = _t("Identifier")
+        self.Platform = _t("Platform_name_platform_version")
+        self.Binary = _t("Binary_literal")
+        self.Octal = _t("Octal_literal")
+        self.Decimal = _t("Decimal_literal")
+        self.Hexadecimal = _t("Hexadecimal_literal")
+        self.Float = _t("Floating_point_literal")
+        self.Static = _t("Static_string_literal")
+        self.Interpolated = _t("Interpolated_string_literal")
+        self.WS = _t("WS")
+        self.Block_comment = _t("Block_comment")
+        self.Line_comment = _t("Line_comment")
+        self.Op_head_other = _t("Operator_head_other")
+        self.Op_following = _t("Operator_following_character")
+        self.hidden = {self.WS, self.Block_comment, self.Line_comment}
+
+
+_TABLE = None
+
+def _token_table() -> _TokenTable:
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = _TokenTable(Swift3Lexer)
+    return _TABLE
+
+
+def _scan_block_comment(text: str, pos: int):
+    """
+    Block_comment : '/*' (Block_comment | .)*? '*/'  — vrati kraj ili None.
+    Bez ugniježđenog '/*' prije prvog '*/' kraj je odmah poznat; inače se
+    simulira ANTLR-ov ATN: konfiguracije po prioritetu (izlaz > ugniježđeni
+    komentar > '.'), a kad jedna dođe do kraja pravila, niže se odbacuju.
+    """
+    close = text.find("*/", pos + 2)
+    if close != -1 and text.find("/*", pos + 2, close + 1) == -1:
+        return close + 2
+
+    def loop(d):
+        return [("c*", d), ("o/", d), ("any", d)]
+
+    configs = loop(1)
+    last = None
+    for i in range(pos + 2, len(text)):
+        ch = text[i]
+        reach, seen, accepted = [], set(), False
+
+        def add(cfgs):
+            for c in cfgs:
+                if c not in seen:
+                    seen.add(c)
+                    reach.append(c)
+
+        for kind, d in configs:
+            if kind == "c*":
+                if ch == "*":
+                    add([("c/", d)])
+            elif kind == "c/":
+                if ch == "/":
+                    if d == 1:
+                        accepted = True
+                        break
+                    add(loop(d - 1))
+            elif kind == "o/":
+                if ch == "/":
+                    add([("o*", d)])
+            elif kind == "o*":
+                if ch == "*":
+                    add(loop(d + 1))
+            else:
+                add(loop(d))
+        if accepted:
+            last = i + 1
+        if not reach:
+            break
+        configs = reach
+    return last
+
+
+def _scan_interpolated(text: str, pos: int):
+    """
+    Interpolated_string_literal (dozvoljava ugniježđene stringove u \\( ... )).
+    Vrati (kraj najdužeg poklapanja ili None, indeks znaka na kojem sve grane umiru).
+    Konfiguracija = (stek okvira 'S'/'G', podstanje); 'G0' je prazna \\( grupa.
+    """
+    configs = {(("S",), "N")}
+    last = None
+    i = pos + 1
+    n = len(text)
+    while i < n and configs:
+        ch = text[i]
+        nxt = set()
+        for stack, sub in configs:
+            top = stack[-1]
+            if sub in ("N", "G0"):
+                if ch in "\n\r":
+                    continue
+                if ch == "\\":
+                    nxt.add((stack, "E"))
+                elif top == "S":
+                    if ch == '"':
+                        if len(stack) == 1:
+                            last = i + 1
+                        else:
+                            nxt.add((stack[:-1], "N"))
+                    else:
+                        nxt.add((stack, "N"))
+                else:
+                    if ch == '"':
+                        nxt.add((stack + ("S",), "N"))
+                    elif ch == ")":
+                        nxt.add((stack, "N"))
+                        if sub == "N":
+                            nxt.add((stack[:-1], "N"))
+                    else:
+                        nxt.add((stack, "N"))
+            elif sub == "E":
+                if ch in "0\\tnr\"'":
+                    nxt.add((stack, "N"))
+                elif ch == "x":
+                    nxt.add((stack, "X0"))
+                elif ch == "u":
+                    nxt.add((stack, "U"))
+                elif ch == "(":
+                    nxt.add((stack + ("G",), "G0"))
+            elif sub == "X0":
+                if ch in _HEX:
+                    nxt.add((stack, "X1"))
+            elif sub == "X1":
+                if ch in _HEX:
+                    nxt.add((stack, "N"))
+            elif sub == "U":
+                if ch == "{":
+                    nxt.add((stack, 0))
+            else:
+                if ch in _HEX and sub < 8:
+                    nxt.add((stack, sub + 1))
+                elif ch == "}" and sub in (4, 8):
+                    nxt.add((stack, "N"))
+        configs = nxt
+        if configs:
+            i += 1
+    return last, i
+
+
+class Swift3RegexLexer(Recognizer, TokenSource):
+    """Izvor tokena kompatibilan sa Swift3LexerEx (za CommonTokenStream)."""
+
+    def __init__(self, input, output=None):
+        super().__init__()
+        self._input = input
+        self._text = input.strdata
+        self._pos = 0
+        self._line = 1
+        self._column = 0
+        self._hitEOF = False
+        self._factory = CommonTokenFactory.DEFAULT
+        self._tokenFactorySourcePair = (self, input)
+        self._t = _token_table()
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    @property
+    def line(self):
+        return self._line
+
+    @property
+    def column(self):
+        return self._column
+
+    def getSourceName(self):
+        return getattr(self._input, "name", None) or "<unknown>"
+
+    def reset(self):
+        self._pos, self._line, self._column, self._hitEOF = 0, 1, 0, False
+
+    def getAllTokens(self):
+        tokens = []
+        t = self.nextToken()
+        while t.type != Token.EOF:
+            tokens.append(t)
+            t = self.nextToken()
+        return tokens
+
+    def nextToken(self):
+        text, n = self._text, len(self._text)
+        while self._pos < n:
+            start = self._pos
+            end, ttype, fail = self._match(start)
+            if ttype is None:
+                self._recognition_error(start, fail)
+                continue
+            channel = Token.HIDDEN_CHANNEL if ttype in self._t.hidden else Token.DEFAULT_CHANNEL
+            tok = self._factory.create(
+                self._tokenFactorySourcePair, ttype, None, channel,
+                start, end - 1, self._line, self._column,
+            )
+            self._advance(start, end)
+            return tok
+        self._hitEOF = True
+        return self._factory.create(
+            self._tokenFactorySourcePair, Token.EOF, None, Token.DEFAULT_CHANNEL,
+            n, n - 1, self._line, self._column,
+        )
+
+    def _advance(self, start: int, end: int) -> None:
+        nl = self._text.count("\n", start, end)
+        if nl:
+            self._line += nl
+            self._column = end - (self._text.rfind("\n", start, end) + 1)
+        else:
+            self._column += end - start
+        self._pos = end
+
+    def _match(self, pos: int):
+        """(kraj, tip, None) najboljeg kandidata; bez kandidata (None, None, indeks greške)."""
+        text, t = self._text, self._t
+        best_end, best_type = -1, None
+
+        def offer(end, ttype):
+            nonlocal best_end, best_type
+            if end > best_end or (end == best_end and ttype < best_type):
+                best_end, best_type = end, ttype
+
+        m = t.literal_re.match(text, pos)
+        if m:
+            offer(m.end(), t.literals[m.group()])
+
+        c = text[pos]
+        fail = None
+        if c in _WS_CHARS:
+            offer(_WS.match(text, pos).end(), t.WS)
+        elif c == '"':
+            m = _STATIC_STRING.match(text, pos)
+            if m:
+                offer(m.end(), t.Static)
+            else:
+                end, fail = _scan_interpolated(text, pos)
+                if end is not None:
+                    offer(end, t.Interpolated)
+        elif c == "/" and text.startswith("//", pos):
+            end = text.find("\n", pos + 2)
+            offer(len(text) if end == -1 else end + 1, t.Line_comment)
+        elif c == "/" and text.startswith("/*", pos):
+            end = _scan_block_comment(text, pos)
+            if end is not None:
+                offer(end, t.Block_comment)
+        elif "0" <= c <= "9":
+            for rx, ttype in ((_BINARY, t.Binary), (_OCTAL, t.Octal), (_DECIMAL, t.Decimal),
+                              (_HEXADECIMAL, t.Hexadecimal), (_FLOAT_DECIMAL, t.Float),
+                              (_FLOAT_HEXADECIMAL, t.Float)):
+                m = rx.match(text, pos)
+                if m:
+                    offer(m.end(), ttype)
+        else:
+            m = _IDENTIFIER.match(text, pos)
+            if m:
+                offer(m.end(), t.Identifier)
+            if c in "imwt":
+                m = _PLATFORM.match(text, pos)
+                if m:
+                    offer(m.end(), t.Platform)
+            if _OP_HEAD_OTHER_RE.match(text, pos):
+                offer(pos + 1, t.Op_head_other)
+            elif _OP_FOLLOWING_RE.match(text, pos):
+                offer(pos + 1, t.Op_following)
+
+        if best_type is not None:
+            return best_end, best_type, None
+        return None, None, self._fail_index(pos, fail)
+
+    def _fail_index(self, pos: int, string_fail) -> int:
+        """Indeks znaka na kojem ANTLR-ov lekser ostaje bez ijedne žive grane."""
+        if string_fail is not None:
+            return string_fail
+        text, k = self._text, 0
+        while pos + k < len(text) and text[pos:pos + k + 1] in self._t.prefixes:
+            k += 1
+        if text[pos] == "$":
+            k = max(k, 1)
+        elif text[pos] == "`":
+            # '`' Identifier_head Identifier_characters? '`' je živ do prvog znaka koji ga ne nastavlja
+            k = max(k, _BACKTICK_PREFIX.match(text, pos).end() - pos)
+        return pos + k
+
+    def _recognition_error(self, start: int, fail: int) -> None:
+        """Kao Lexer.notifyListeners + recover: prijavi i preskoči zaključno sa znakom greške."""
+        bad = self._text[start:fail + 1]
+        msg = "token recognition error at: '" + "".join(
+            {"\n": "\\n", "\t": "\\t", "\r": "\\r"}.get(ch, ch) for ch in bad
+        ) + "'"
+        self.getErrorListenerDispatch().syntaxError(self, None, self._line, self._column, msg, None)
+        self._advance(start, min(fail + 1, len(self._text)))
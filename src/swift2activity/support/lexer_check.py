@@ -0,0 +1,110 @@
+"""
+Diferencijalna provjera i benchmark: Swift3RegexLexer vs ANTLR Swift3LexerEx.
+
+    python -m swift2activity.support.lexer_check KORPUS...          # token po token
+    python -m swift2activity.support.lexer_check --bench KORPUS...  # propusnost
+"""
+import argparse
+import os
+import time
+from typing import List, Optional
+from antlr4 import InputStream, Token
+from antlr4.error.ErrorListener import ErrorListener
+from .Swift3LexerEx import Swift3LexerEx
+from .Swift3RegexLexer import Swift3RegexLexer
+
+
+class _CollectErrors(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+
+def _lex(lexer_cls, text: str):
+    lexer = lexer_cls(InputStream(text))
+    lexer.removeErrorListeners()
+    errs = _CollectErrors()
+    lexer.addErrorListener(errs)
+    out = []
+    while True:
+        t = lexer.nextToken()
+        out.append((t.type, t.channel, t.start, t.stop, t.line, t.column, t.text))
+        if t.type == Token.EOF:
+            return out, errs.errors
+
+
+def diff_tokens(text: str) -> Optional[str]:
+    """Opis prve razlike između dva leksera, ili None ako su izlazi identični."""
+    ref, ref_errs = _lex(Swift3LexerEx, text)
+    got, got_errs = _lex(Swift3RegexLexer, text)
+    for i, (a, b) in enumerate(zip(ref, got)):
+        if a != b:
+            return f"token #{i}: antlr={a!r} regex={b!r}"
+    if len(ref) != len(got):
+        return f"broj tokena: antlr={len(ref)} regex={len(got)}"
+    if ref_errs != got_errs:
+        return f"greške: antlr={ref_errs!r} regex={got_errs!r}"
+    return None
+
+
+def collect_corpus(paths) -> List[str]:
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _, names in os.walk(p):
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".swift"))
+        else:
+            files.append(p)
+    return files
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def check_corpus(files) -> int:
+    failed = 0
+    for path in files:
+        d = diff_tokens(_read(path))
+        if d is not None:
+            failed += 1
+            print(f"DIFF {path}: {d}")
+    print(f"{len(files) - failed}/{len(files)} fajlova identično")
+    return failed
+
+
+def bench(files, repeat: int = 3) -> None:
+    texts = [_read(p) for p in files]
+    chars = sum(len(t) for t in texts)
+    best = {}
+    for name, cls in (("antlr", Swift3LexerEx), ("regex", Swift3RegexLexer)):
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for text in texts:
+                _lex(cls, text)
+            times.append(time.perf_counter() - t0)
+        best[name] = min(times)
+        print(f"{name:6s} {best[name]:8.3f} s  {chars / best[name] / 1000:10.1f} kchar/s")
+    print(f"ubrzanje: {best['antlr'] / best['regex']:.1f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Swift3RegexLexer vs ANTLR lekser")
+    ap.add_argument("paths", nargs="+", help=".swift fajlovi ili direktorijumi")
+    ap.add_argument("--bench", action="store_true", help="mjeri propusnost umjesto poređenja")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    files = collect_corpus(args.paths)
+    if args.bench:
+        bench(files, args.repeat)
+    else:
+        raise SystemExit(1 if check_corpus(files) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from swift2activity.emitters.batch import dedupe_graphs
+from swift2activity.ir.cfg import Graph
+from swift2activity.ir.nodes import Initial, Final, Action
+
+
+def _linear(*labels):
+    g = Graph()
+    prev = g.add(Initial())
+    for lbl in labels:
+        a = g.add(Action(lbl))
+        g.link(prev, a)
+        prev = a
+    g.link(prev, g.add(Final()))
+    return g
+
+
+def test_identical_graphs_share_one_artifact():
+    artifacts, index = dedupe_graphs([
+        ("a.swift::Foo.f(_:Int)", _linear("x = 1")),
+        ("b.swift::Bar.g()", _linear("x = 1")),
+        ("a.swift::Foo.h()", _linear("y = 2")),
+    ])
+    assert len(artifacts) == 2
+    assert index["a.swift::Foo.f(_:Int)"]["artifact"] == index["b.swift::Bar.g()"]["artifact"]
+    assert index["a.swift::Foo.h()"]["shape"] == index["b.swift::Bar.g()"]["shape"]
+
+
+def test_duplicate_names_are_kept():
+    _, index = dedupe_graphs([
+        ("a.swift::f()", _linear("x")),
+        ("a.swift::f()", _linear("y")),
+        ("a.swift::f()", _linear("z")),
+    ])
+    assert sorted(index) == ["a.swift::f()", "a.swift::f()#2", "a.swift::f()#3"]
@@ -0,0 +1,108 @@
+from swift2activity.ir.cfg import Graph
+from swift2activity.ir.nodes import Initial, Final, Action, Decision, Merge
+
+
+def _diamond(order, then_label="a", else_label="b", swap_edges=False):
+    """Initial → Decision → (then | else) → Merge → Final, čvorovi dodani redom 'order'."""
+    g = Graph()
+    make = {
+        "s": Initial, "e": Final, "m": Merge,
+        "d": lambda: Decision("x > 0"),
+        "t": lambda: Action(then_label), "f": lambda: Action(else_label),
+    }
+    idx = {k: g.add(make[k]()) for k in order}
+    edges = [("s", "d", None), ("d", "t", "yes"), ("d", "f", "no"),
+             ("t", "m", None), ("f", "m", None), ("m", "e", None)]
+    if swap_edges:
+        edges.reverse()
+    for a, b, lbl in edges:
+        g.link(idx[a], idx[b], lbl)
+    return g
+
+
+def test_hash_ignores_node_numbering():
+    a = _diamond("sedtfm")
+    b = _diamond("mftdes")
+    assert a.structural_hash() == b.structural_hash()
+    assert a.structural_hash(include_labels=False) == b.structural_hash(include_labels=False)
+
+
+def test_hash_ignores_edge_insertion_order():
+    a = _diamond("sedtfm")
+    b = _diamond("sedtfm", swap_edges=True)
+    assert a.structural_hash() == b.structural_hash()
+
+
+def test_tied_successors_in_any_order():
+    def g(first, second):
+        g = Graph()
+        s, x, y, e = g.add(Initial()), g.add(Action("x")), g.add(Action("x")), g.add(Final())
+        nodes = {"a": x, "b": y}
+        g.link(s, nodes[first])
+        g.link(s, nodes[second])
+        g.link(x, e)
+        g.link(y, e)
+        return g
+    assert g("a", "b").structural_hash() == g("b", "a").structural_hash()
+    assert g("a", "b").structural_hash(False) == g("b", "a").structural_hash(False)
+
+
+def test_labels_only_matter_in_label_mode():
+    a = _diamond("sedtfm", then_label="a")
+    b = _diamond("sedtfm", then_label="zzz")
+    assert a.structural_hash() != b.structural_hash()
+    assert a.structural_hash(include_labels=False) == b.structural_hash(include_labels=False)
+
+
+def test_branch_labels_distinguish_swapped_branches():
+    a = _diamond("sedtfm", then_label="a", else_label="b")
+    b = _diamond("sedtfm", then_label="b", else_label="a")
+    assert a.structural_hash() != b.structural_hash()
+
+
+def test_different_shapes_differ():
+    a = _diamond("sedtfm")
+    g = Graph()
+    s, x, e = g.add(Initial()), g.add(Action("a")), g.add(Final())
+    g.link(s, x)
+    g.link(x, e)
+    assert a.structural_hash(False) != g.structural_hash(False)
+
+
+def _actions_with_cycles(cycles):
+    """Initial → 6×Action('x') → Final, plus ciklusi među akcijama (1-WL ih ne razlikuje)."""
+    g = Graph()
+    s = g.add(Initial())
+    acts = [g.add(Action("x")) for _ in range(6)]
+    e = g.add(Final())
+    for a in acts:
+        g.link(s, a)
+        g.link(a, e)
+    for cyc in cycles:
+        for i, a in enumerate(cyc):
+            g.link(acts[a], acts[cyc[(i + 1) % len(cyc)]])
+    return g
+
+
+def test_regular_non_isomorphic_graphs_differ():
+    six = _actions_with_cycles([[0, 1, 2, 3, 4, 5]])
+    two_threes = _actions_with_cycles([[0, 1, 2], [3, 4, 5]])
+    assert six.structural_hash() != two_threes.structural_hash()
+    assert six.structural_hash(False) != two_threes.structural_hash(False)
+    assert six.structural_hash() == _actions_with_cycles([[3, 0, 5, 1, 4, 2]]).structural_hash()
+    assert two_threes.structural_hash() == _actions_with_cycles([[5, 1, 3], [0, 4, 2]]).structural_hash()
+
+
+def test_many_identical_branches():
+    def switch(n, order):
+        g = Graph()
+        s, d, m, e = g.add(Initial()), g.add(Decision("k")), g.add(Merge()), g.add(Final())
+        g.link(s, d)
+        g.link(m, e)
+        acts = [g.add(Action("x")) for _ in range(n)]
+        for i in order:
+            g.link(d, acts[i], "case")
+            g.link(acts[i], m)
+        return g
+    n = 40
+    assert switch(n, range(n)).structural_hash() == switch(n, reversed(range(n))).structural_hash()
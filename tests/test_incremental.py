@@ -0,0 +1,108 @@
+import time
+import pytest
+
+pytest.importorskip("antlr4")
+pytest.importorskip("generated.Swift3Parser", reason="generated/ nema Swift3Parser (pokreni scripts/gen_antlr.ps1)")
+
+from swift2activity.frontend.incremental import IncrementalParser, diff_against_full  # noqa: E402
+
+SOURCE = """import Foundation
+
+// pomoćne funkcije
+// bez stanja
+func clamp(_ x: Int) -> Int {
+    if x > 0 {
+        return x
+    }
+    return 0
+}
+
+class Counter {
+    // stanje
+    var count = 0
+
+    func inc(by n: Int) {
+        count += n
+    }
+
+    func reset() {
+        if count > 10 {
+            count = 0
+        } else {
+            count = 1
+        }
+    }
+}
+
+struct Point {
+    let x: Int
+    func norm() -> Int { return x }
+}
+"""
+
+# (staro, novo, očekivani last_mode); primjenjuju se redom nad istim parserom
+EDITS = [
+    # tijelo metode
+    ("count += n", "count += n * 2", "member"),
+    ("count = 0\n        } else", "count = -1\n        } else", "member"),
+    # član koji ne završava sa '}'
+    ("var count = 0", "var count = 5", "member"),
+    # između članova: whitespace, novi član, brisanje člana
+    ("var count = 5\n\n", "var count = 5\n\n\n", "gap"),
+    ("var count = 5\n\n\n", "var count = 5\n\n    func dec() {\n        count -= 1\n    }\n\n", "member"),
+    ("    func dec() {\n        count -= 1\n    }\n\n", "", "member"),
+    ("    let x: Int\n", "    let x: Int\n    var y = 0\n", "member"),
+    ("    var y = 0\n", "", "member"),
+    # ime tipa
+    ("class Counter", "class Tally", "top"),
+    ("struct Point", "struct Pt", "top"),
+    # top-level funkcija bez članova
+    ("return 0", "return -1", "top"),
+    # whitespace i komentari u prazninama
+    ("}\n\nclass Tally", "}\n\n\nclass Tally", "gap"),
+    ("// bez stanja", "// bez ikakvog stanja", "full"),
+    ("// pomoćne funkcije\n", "// pomoćne funkcije", "full"),
+    ("// stanje", "// brojač", "top"),
+    ("count += n * 2", "count += n * 2 /* x2 */", "full"),
+    # neuravnotežene zagrade: greška pa popravka
+    ("func reset() {", "func reset() { {", "full"),
+    ("func reset() { {", "func reset() {", None),
+    ("        return x\n    }\n", "        return x\n", "full"),
+    ("        return x\n", "        return x\n    }\n", None),
+]
+
+
+def test_incremental_matches_full_parse():
+    inc = IncrementalParser(SOURCE)
+    assert diff_against_full(inc) is None
+    for old, new, mode in EDITS:
+        assert old in inc.text, old
+        got = inc.update(inc.text.replace(old, new, 1))
+        assert diff_against_full(inc) is None, (old, new, got)
+        if mode is not None:
+            assert got == mode, (old, new)
+
+
+def _edit_latency(inc, repeat=5):
+    """Najbolje vrijeme jedne izmjene tijela metode (naizmjenično tamo i nazad)."""
+    best = float("inf")
+    for k in range(repeat):
+        old, new = ("count += n", "count += n + 1") if k % 2 == 0 else ("count += n + 1", "count += n")
+        text = inc.text.replace(old, new, 1)
+        t0 = time.perf_counter()
+        mode = inc.update(text)
+        best = min(best, time.perf_counter() - t0)
+        assert mode == "member"
+    return best
+
+
+def test_edit_latency_does_not_depend_on_file_size():
+    # veliki fajl: 2000 metoda u istom tipu iza izmijenjene (sve se pomjeraju) + top-level funkcije
+    methods = "".join(f"    func m{i}() {{\n        count += {i}\n    }}\n\n" for i in range(2000))
+    functions = "".join(f"\nfunc f{i}(_ x: Int) -> Int {{\n    return x + {i}\n}}\n" for i in range(100))
+    large_source = SOURCE.replace("    func reset()", methods + "    func reset()", 1) + functions
+    small = IncrementalParser(SOURCE)
+    large = IncrementalParser(large_source)
+    t_small, t_large = _edit_latency(small), _edit_latency(large)
+    assert diff_against_full(large) is None
+    assert t_large < 3 * t_small + 0.01, (t_small, t_large)
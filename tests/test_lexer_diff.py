@@ -0,0 +1,16 @@
+import os
+import pytest
+
+pytest.importorskip("antlr4")
+pytest.importorskip("generated.Swift3Lexer", reason="generated/ nema Swift3Lexer (pokreni scripts/gen_antlr.ps1)")
+
+from swift2activity.support.lexer_check import collect_corpus, diff_tokens  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples")
+CORPUS = collect_corpus([EXAMPLES])
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[os.path.relpath(p, EXAMPLES) for p in CORPUS])
+def test_regex_lexer_matches_antlr(path):
+    with open(path, encoding="utf-8") as f:
+        assert diff_tokens(f.read()) is None